@@ -9,18 +9,35 @@ import aqt
 from aqt import gui_hooks
 
 from .addon_config import addon_module_name, refresh_settings
-from .browser_features import install_hooks, refresh_browser_view
-from .settings_dialog import setup_config_menu
+from .browser_features import install_hooks, rebuild_paint_caches, refresh_browser_view
 
 
 def _on_config_updated(*_args, **_kwargs) -> None:
     refresh_settings()
+    rebuild_paint_caches()
     refresh_browser_view(force_refetch=True)
 
 
+def _open_settings_dialog() -> None:
+    from .settings_dialog import open_settings_dialog
+
+    open_settings_dialog()
+
+
+def _setup_config_menu() -> None:
+    if aqt.mw is None:
+        return
+    if getattr(aqt.mw, "_flag_column_config_action", None) is not None:
+        return
+    action = aqt.mw.form.menuTools.addAction("Flag Column Settings...")
+    action.triggered.connect(_open_settings_dialog)
+    aqt.mw._flag_column_config_action = action
+
+
 def _on_profile_did_open() -> None:
     refresh_settings()
-    setup_config_menu()
+    rebuild_paint_caches()
+    _setup_config_menu()
     if aqt.mw is None:
         return
     aqt.mw.addonManager.setConfigUpdatedAction(addon_module_name(), _on_config_updated)
@@ -32,11 +32,12 @@ class AddonSettings:
         }
 
 
+_ADDON_MODULE_NAME = (__package__ or __name__).split(".", 1)[0]
 _CURRENT_SETTINGS = AddonSettings()
 
 
 def addon_module_name() -> str:
-    return (__package__ or __name__).split(".", 1)[0]
+    return _ADDON_MODULE_NAME
 
 
 def get_settings() -> AddonSettings:
@@ -48,7 +49,7 @@ def refresh_settings() -> AddonSettings:
     if aqt.mw is None:
         _CURRENT_SETTINGS = AddonSettings()
         return _CURRENT_SETTINGS
-    config = aqt.mw.addonManager.getConfig(addon_module_name()) or {}
+    config = aqt.mw.addonManager.getConfig(_ADDON_MODULE_NAME) or {}
     _CURRENT_SETTINGS = _sanitize_settings(config)
     return _CURRENT_SETTINGS
 
@@ -60,13 +61,13 @@ def save_settings(settings: AddonSettings) -> AddonSettings:
     if aqt.mw is None:
         return sanitized
 
-    config = (aqt.mw.addonManager.getConfig(addon_module_name()) or {}).copy()
+    config = (aqt.mw.addonManager.getConfig(_ADDON_MODULE_NAME) or {}).copy()
     updated_config = config.copy()
     updated_config.update(sanitized.to_config())
     if updated_config == config:
         return sanitized
 
-    aqt.mw.addonManager.writeConfig(addon_module_name(), updated_config)
+    aqt.mw.addonManager.writeConfig(_ADDON_MODULE_NAME, updated_config)
     return sanitized
 
 
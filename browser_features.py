@@ -8,8 +8,9 @@ from anki.consts import (
     QUEUE_TYPE_SUSPENDED,
 )
 from aqt import colors, gui_hooks
-from aqt.browser.table import Column, StatusDelegate, adjusted_bg_color
+from aqt.browser.table import CellRow, Column, StatusDelegate, adjusted_bg_color
 from aqt.qt import (
+    QBrush,
     QFont,
     QColor,
     QHeaderView,
@@ -17,10 +18,11 @@ from aqt.qt import (
     QPainter,
     QPainterPath,
     QPen,
+    QPixmap,
     QRect,
-    QRectF,
     QStyleOptionViewItem,
     Qt,
+    QTimer,
 )
 from aqt.theme import theme_manager
 
@@ -42,9 +44,6 @@ FLAG_PREVIEW_COLORS = (
     colors.FLAG_7,
 )
 
-_FLAG_COLOR_BY_INDEX = {
-    index: color for index, color in enumerate(FLAG_PREVIEW_COLORS, start=1)
-}
 _FLAG_COLUMN_KEY = "_flag_indicator"
 _FLAG_COLUMN_WIDTH = 21
 _SORT_FIELD_COLUMN_KEY = "noteFld"
@@ -54,6 +53,7 @@ _STATE_BURIED = "buried"
 _STATE_SYMBOL_SUSPENDED = "!"
 _STATE_SYMBOL_MARKED = "✱"
 _STATE_SYMBOL_BURIED = "→"
+_BURIED_QUEUES = frozenset({QUEUE_TYPE_MANUALLY_BURIED, QUEUE_TYPE_SIBLING_BURIED})
 _STATE_BADGE_MARGIN = 4
 _STATE_BADGE_SPACING = 3
 _STATE_TEXT_GAP = 0
@@ -65,7 +65,20 @@ from cards c
 join notes n on n.id = c.nid
 where c.id = ?
 """
+_ANTIALIASING = QPainter.RenderHint.Antialiasing
 _HOOKS_INSTALLED = False
+_REFRESH_PENDING = False
+_REFRESH_FORCE_REFETCH = False
+_FLAG_PENS: tuple[QPen | None, ...] = ()
+_FLAG_BRUSHES: tuple[QBrush | None, ...] = ()
+_STATE_BADGE_PAINT: dict[str, tuple[QColor, QPen]] = {}
+_NIGHT_MODE = False
+_ROW_BG_QCOLORS: dict[str, QColor] = {}
+_FLAG_PIXMAPS: dict[tuple[int, str, int, int, float], QPixmap | None] = {}
+_BADGE_PIXMAPS: dict[tuple[tuple[str, ...], str, int, int, bool, float], QPixmap] = {}
+_ROW_DECORATIONS: dict[
+    tuple[int, bool], tuple[dict[str, str] | None, tuple[str, ...]]
+] = {}
 
 
 def flag_theme_qcolor(flag_color: dict[str, str] | None, night_mode: bool) -> QColor:
@@ -89,6 +102,19 @@ def outline_color_for_mode(
 
 
 def refresh_browser_view(force_refetch: bool = False) -> None:
+    global _REFRESH_PENDING, _REFRESH_FORCE_REFETCH
+    _REFRESH_FORCE_REFETCH = _REFRESH_FORCE_REFETCH or force_refetch
+    if _REFRESH_PENDING:
+        return
+    _REFRESH_PENDING = True
+    QTimer.singleShot(0, _run_pending_refresh)
+
+
+def _run_pending_refresh() -> None:
+    global _REFRESH_PENDING, _REFRESH_FORCE_REFETCH
+    force_refetch = _REFRESH_FORCE_REFETCH
+    _REFRESH_PENDING = False
+    _REFRESH_FORCE_REFETCH = False
     if aqt.mw is None:
         return
     browser = getattr(aqt.mw, "browser", None)
@@ -111,13 +137,35 @@ def refresh_browser_view(force_refetch: bool = False) -> None:
         view.viewport().update()
 
 
+def rebuild_paint_caches() -> None:
+    global _FLAG_PENS, _FLAG_BRUSHES, _STATE_BADGE_PAINT, _NIGHT_MODE
+    _NIGHT_MODE = theme_manager.night_mode
+    _ROW_BG_QCOLORS.clear()
+    _FLAG_PIXMAPS.clear()
+    _BADGE_PIXMAPS.clear()
+    _FLAG_PENS = (
+        None,
+        *(QPen(_outline_color(color), 1) for color in FLAG_PREVIEW_COLORS),
+    )
+    _FLAG_BRUSHES = (
+        None,
+        *(QBrush(theme_manager.qcolor(color)) for color in FLAG_PREVIEW_COLORS),
+    )
+    _STATE_BADGE_PAINT = {
+        state: _state_badge_paint(state) for state in _STATE_ICON_COLORS
+    }
+
+
 def install_hooks() -> None:
     global _HOOKS_INSTALLED
     if _HOOKS_INSTALLED:
         return
+    CellRow._flag_indicator = 0
+    CellRow._state_badges = ()
     gui_hooks.browser_did_fetch_columns.append(_on_browser_did_fetch_columns)
     gui_hooks.browser_will_show.append(_on_browser_will_show)
     gui_hooks.browser_did_fetch_row.append(_on_browser_did_fetch_row)
+    gui_hooks.theme_did_change.append(_on_theme_did_change)
     _HOOKS_INSTALLED = True
 
 
@@ -136,19 +184,11 @@ def _color_key(color: dict[str, str] | None) -> tuple[str | None, str | None] |
     return (color.get("light"), color.get("dark"))
 
 
-_FLAG_INDEX_BY_BG_KEY = {
-    key: index
-    for index, color in _FLAG_COLOR_BY_INDEX.items()
-    if (key := _color_key(adjusted_bg_color(color))) is not None
-}
-_MARKED_BG_KEY = _color_key(adjusted_bg_color(colors.STATE_MARKED))
-_SUSPENDED_BG_KEY = _color_key(adjusted_bg_color(colors.STATE_SUSPENDED))
-_BURIED_BG_KEY = _color_key(adjusted_bg_color(colors.STATE_BURIED))
-_STATE_BG_COLORS = {
-    _STATE_MARKED: adjusted_bg_color(colors.STATE_MARKED),
-    _STATE_SUSPENDED: adjusted_bg_color(colors.STATE_SUSPENDED),
-    _STATE_BURIED: adjusted_bg_color(colors.STATE_BURIED),
-}
+_NO_ROW_STATE = (0, 0, False)
+_ROW_STATE_BY_BG_KEY: dict[tuple[str | None, str | None], tuple[int, int, bool]] = {}
+_MARKED_BG: dict[str, str] | None = None
+_SUSPENDED_BG: dict[str, str] | None = None
+_BURIED_BG: dict[str, str] | None = None
 _STATE_BADGE_TEXT = {
     _STATE_MARKED: _STATE_SYMBOL_MARKED,
     _STATE_SUSPENDED: _STATE_SYMBOL_SUSPENDED,
@@ -161,6 +201,23 @@ _STATE_ICON_COLORS = {
 }
 
 
+def _build_row_state_tables() -> None:
+    global _MARKED_BG, _SUSPENDED_BG, _BURIED_BG
+    _MARKED_BG = adjusted_bg_color(colors.STATE_MARKED)
+    _SUSPENDED_BG = adjusted_bg_color(colors.STATE_SUSPENDED)
+    _BURIED_BG = adjusted_bg_color(colors.STATE_BURIED)
+    for index, color in enumerate(FLAG_PREVIEW_COLORS, start=1):
+        if (key := _color_key(adjusted_bg_color(color))) is not None:
+            _ROW_STATE_BY_BG_KEY[key] = (index, 0, False)
+    _ROW_STATE_BY_BG_KEY[_color_key(_MARKED_BG)] = (0, 0, True)
+    _ROW_STATE_BY_BG_KEY[_color_key(_SUSPENDED_BG)] = (0, QUEUE_TYPE_SUSPENDED, False)
+    _ROW_STATE_BY_BG_KEY[_color_key(_BURIED_BG)] = (
+        0,
+        QUEUE_TYPE_MANUALLY_BURIED,
+        False,
+    )
+
+
 def _lookup_card_state(card_id: int) -> tuple[int, bool] | None:
     if aqt.mw is None or aqt.mw.col is None:
         return None
@@ -173,11 +230,11 @@ def _lookup_card_state(card_id: int) -> tuple[int, bool] | None:
 
 def _base_color_for_state(queue: int, is_marked: bool) -> dict[str, str] | None:
     if is_marked:
-        return _STATE_BG_COLORS[_STATE_MARKED]
+        return _MARKED_BG
     if queue == QUEUE_TYPE_SUSPENDED:
-        return _STATE_BG_COLORS[_STATE_SUSPENDED]
-    if queue in (QUEUE_TYPE_MANUALLY_BURIED, QUEUE_TYPE_SIBLING_BURIED):
-        return _STATE_BG_COLORS[_STATE_BURIED]
+        return _SUSPENDED_BG
+    if queue in _BURIED_QUEUES:
+        return _BURIED_BG
     return None
 
 
@@ -187,30 +244,32 @@ def _state_badges(queue: int, is_marked: bool) -> tuple[str, ...]:
         states.append(_STATE_SUSPENDED)
     if is_marked:
         states.append(_STATE_MARKED)
-    if queue in (QUEUE_TYPE_MANUALLY_BURIED, QUEUE_TYPE_SIBLING_BURIED):
+    if queue in _BURIED_QUEUES:
         states.append(_STATE_BURIED)
     return tuple(states)
 
 
-def _sort_field_index(columns: list[str]) -> int | None:
-    try:
-        return columns.index(_SORT_FIELD_COLUMN_KEY)
-    except ValueError:
-        return None
-
-
-def _display_state(color_key: tuple[str | None, str | None] | None) -> tuple[int, bool]:
-    if color_key == _MARKED_BG_KEY:
-        return 0, True
-    if color_key == _SUSPENDED_BG_KEY:
-        return QUEUE_TYPE_SUSPENDED, False
-    if color_key == _BURIED_BG_KEY:
-        return QUEUE_TYPE_MANUALLY_BURIED, False
-    return 0, False
+def _row_decoration(
+    queue: int, is_marked: bool
+) -> tuple[dict[str, str] | None, tuple[str, ...]]:
+    key = (queue, is_marked)
+    decoration = _ROW_DECORATIONS.get(key)
+    if decoration is None:
+        decoration = (
+            _base_color_for_state(queue, is_marked),
+            _state_badges(queue, is_marked),
+        )
+        _ROW_DECORATIONS[key] = decoration
+    return decoration
 
 
-def _flag_color(flag_index: int) -> dict[str, str] | None:
-    return _FLAG_COLOR_BY_INDEX.get(flag_index)
+def _row_bg_qcolor(row_color: dict[str, str]) -> QColor:
+    name = row_color["dark"] if _NIGHT_MODE else row_color["light"]
+    qcolor = _ROW_BG_QCOLORS.get(name)
+    if qcolor is None:
+        qcolor = QColor(name)
+        _ROW_BG_QCOLORS[name] = qcolor
+    return qcolor
 
 
 def _state_icon_fill(state: str) -> QColor:
@@ -223,6 +282,11 @@ def _badge_text_color(fill: QColor) -> QColor:
     return QColor("#111111") if luminance > 150 else QColor("#F7F9FB")
 
 
+def _state_badge_paint(state: str) -> tuple[QColor, QPen]:
+    fill = _state_icon_fill(state)
+    return fill, QPen(_badge_text_color(fill), 1)
+
+
 def _state_badge_text(state: str) -> str:
     return _STATE_BADGE_TEXT.get(state, "?")
 
@@ -230,61 +294,113 @@ def _state_badge_text(state: str) -> str:
 class FlagIconDelegate(StatusDelegate):
     def __init__(self, browser, model) -> None:
         super().__init__(browser, model)
-        self._glyph_cache: dict[str, tuple[QPainterPath, QRectF]] = {}
+        self._flag_column: int | None = None
+        self._sort_field_column: int | None = None
+        self._columns_stale = True
+        for signal in (
+            model.modelReset,
+            model.layoutChanged,
+            model.columnsInserted,
+            model.columnsRemoved,
+            model.columnsMoved,
+            model.headerDataChanged,
+        ):
+            signal.connect(self._mark_columns_stale)
 
-    def _glyph_path(
-        self, base_font: QFont, pixel_size: int
-    ) -> tuple[QPainterPath, QRectF]:
-        font = QFont(base_font)
-        font.setPixelSize(pixel_size)
-        key = font.toString()
-        cached = self._glyph_cache.get(key)
-        if cached is not None:
-            return cached
-        path = QPainterPath()
-        path.addText(0, 0, font, FLAG_GLYPH)
-        cached = (path, path.boundingRect())
-        self._glyph_cache[key] = cached
-        return cached
+    def _mark_columns_stale(self, *_args) -> None:
+        self._columns_stale = True
+
+    def _refresh_column_indexes(self) -> None:
+        self._flag_column = self._model.active_column_index(_FLAG_COLUMN_KEY)
+        self._sort_field_column = self._model.active_column_index(
+            _SORT_FIELD_COLUMN_KEY
+        )
+        self._columns_stale = False
 
     def paint(
         self, painter: QPainter | None, option: QStyleOptionViewItem, index: QModelIndex
     ) -> None:
-        column_key = self._model.column_at(index).key
-        if column_key == _SORT_FIELD_COLUMN_KEY and self._paint_sort_field_badges(
+        if self._columns_stale:
+            self._refresh_column_indexes()
+        column = index.column()
+        if column == self._flag_column:
+            if painter is not None:
+                self._paint_flag_cell(painter, option, index)
+            return
+        if column == self._sort_field_column and self._paint_sort_field_badges(
             painter, option, index
         ):
             return
-
         super().paint(painter, option, index)
 
-        if column_key != _FLAG_COLUMN_KEY:
-            return
-        row = self._model.get_row(index)
-        flag_index = getattr(row, "_flag_indicator", 0)
-        if not flag_index or painter is None:
-            return
-        flag_color = _flag_color(flag_index)
-        if flag_color is None:
-            return
-
+    def _paint_flag_cell(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> None:
         rect = option.rect
-        size = min(16, rect.height() - 2)
-        if size <= 0:
-            return
-
-        path, bounds = self._glyph_path(option.font, size)
-        center = rect.center()
-        x = center.x() - bounds.center().x()
-        y = center.y() - bounds.center().y()
+        row = self._model.get_row(index)
+        if row_color := row.color:
+            painter.fillRect(rect, _row_bg_qcolor(row_color))
+        self.drawBackground(painter, option, index)
+        flag_index = row._flag_indicator
+        if flag_index:
+            self._draw_flag_glyph(painter, rect, option.font, flag_index)
+        self.drawFocus(painter, option, rect)
+
+    def _draw_flag_glyph(
+        self, painter: QPainter, rect: QRect, font: QFont, flag_index: int
+    ) -> None:
+        if not _FLAG_PENS:
+            rebuild_paint_caches()
+        pixmap = self._flag_pixmap(
+            font,
+            rect.width(),
+            rect.height(),
+            flag_index,
+            painter.device().devicePixelRatioF(),
+        )
+        if pixmap is not None:
+            painter.drawPixmap(rect.left(), rect.top(), pixmap)
+
+    def _flag_pixmap(
+        self, font: QFont, width: int, height: int, flag_index: int, ratio: float
+    ) -> QPixmap | None:
+        key = (flag_index, font.family(), width, height, ratio)
+        if key in _FLAG_PIXMAPS:
+            return _FLAG_PIXMAPS[key]
+
+        pixmap = None
+        size = min(16, height - 2)
+        if size > 0:
+            glyph_font = QFont(font)
+            glyph_font.setPixelSize(size)
+            path = QPainterPath()
+            path.addText(0, 0, glyph_font, FLAG_GLYPH)
+            center = path.boundingRect().center()
+            pixmap = QPixmap(round(width * ratio), round(height * ratio))
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            pixmap_painter = QPainter(pixmap)
+            pixmap_painter.setRenderHint(_ANTIALIASING, True)
+            pixmap_painter.setPen(_FLAG_PENS[flag_index])
+            pixmap_painter.setBrush(_FLAG_BRUSHES[flag_index])
+            pixmap_painter.translate(
+                (width - 1) // 2 - center.x(), (height - 1) // 2 - center.y()
+            )
+            pixmap_painter.drawPath(path)
+            pixmap_painter.end()
+        _FLAG_PIXMAPS[key] = pixmap
+        return pixmap
 
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setPen(QPen(_outline_color(flag_color), 1))
-        painter.setBrush(theme_manager.qcolor(flag_color))
-        painter.translate(x, y)
-        painter.drawPath(path)
-        painter.restore()
+    def _badge_font(self, base_font: QFont, badge_size: int, state: str) -> QFont:
+        font = QFont(base_font)
+        font.setBold(True)
+        if state == _STATE_MARKED:
+            font.setPixelSize(max(10, badge_size - 1))
+        elif state == _STATE_BURIED:
+            font.setPixelSize(max(9, badge_size - 3))
+        else:
+            font.setPixelSize(max(8, badge_size - 5))
+        return font
 
     def _paint_sort_field_badges(
         self, painter: QPainter | None, option: QStyleOptionViewItem, index: QModelIndex
@@ -293,7 +409,7 @@ class FlagIconDelegate(StatusDelegate):
             return False
 
         row = self._model.get_row(index)
-        badges = getattr(row, "_state_badges", ())
+        badges = row._state_badges
         if not badges:
             return False
 
@@ -308,7 +424,7 @@ class FlagIconDelegate(StatusDelegate):
 
         if row_color := row.color:
             painter.save()
-            painter.fillRect(paint_option.rect, theme_manager.qcolor(row_color))
+            painter.fillRect(paint_option.rect, _row_bg_qcolor(row_color))
             painter.restore()
 
         self.drawBackground(painter, paint_option, index)
@@ -345,38 +461,53 @@ class FlagIconDelegate(StatusDelegate):
     ) -> None:
         if not badges:
             return
-
-        badge_size = max(12, min(16, rect.height() - 6))
+        if not _STATE_BADGE_PAINT:
+            rebuild_paint_caches()
+
+        base_font = painter.font()
+        ratio = painter.device().devicePixelRatioF()
+        key = (badges, base_font.family(), rect.width(), rect.height(), is_rtl, ratio)
+        pixmap = _BADGE_PIXMAPS.get(key)
+        if pixmap is None:
+            pixmap = self._render_state_badges(
+                base_font, rect.width(), rect.height(), badges, is_rtl, ratio
+            )
+            _BADGE_PIXMAPS[key] = pixmap
+        painter.drawPixmap(rect.left(), rect.top(), pixmap)
+
+    def _render_state_badges(
+        self,
+        base_font: QFont,
+        width: int,
+        height: int,
+        badges: tuple[str, ...],
+        is_rtl: bool,
+        ratio: float,
+    ) -> QPixmap:
+        badge_size = max(12, min(16, height - 6))
         total_width = badge_size * len(badges) + _STATE_BADGE_SPACING * (len(badges) - 1)
-        badge_y = rect.top() + max(1, (rect.height() - badge_size) // 2)
+        badge_y = max(1, (height - badge_size) // 2)
         if is_rtl:
-            start_x = rect.right() - total_width - _STATE_BADGE_MARGIN + 1
+            start_x = width - total_width - _STATE_BADGE_MARGIN
         else:
-            start_x = rect.left() + _STATE_BADGE_MARGIN
-
-        base_font = QFont(painter.font())
-        base_font.setBold(True)
-        base_font.setPixelSize(max(8, badge_size - 5))
+            start_x = _STATE_BADGE_MARGIN
 
-        painter.save()
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        pixmap = QPixmap(round(width * ratio), round(height * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(_ANTIALIASING, True)
         for idx, state in enumerate(badges):
             badge_x = start_x + idx * (badge_size + _STATE_BADGE_SPACING)
-            fill = _state_icon_fill(state)
+            fill, text_pen = _STATE_BADGE_PAINT.get(state) or _state_badge_paint(state)
             text = _state_badge_text(state)
-            text_color = _badge_text_color(fill)
 
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(fill)
             painter.drawRoundedRect(badge_x, badge_y, badge_size, badge_size, 2.5, 2.5)
 
-            symbol_font = QFont(base_font)
-            if state == _STATE_MARKED:
-                symbol_font.setPixelSize(max(10, badge_size - 1))
-            elif state == _STATE_BURIED:
-                symbol_font.setPixelSize(max(9, badge_size - 3))
-            painter.setFont(symbol_font)
-            painter.setPen(QPen(text_color, 1))
+            painter.setFont(self._badge_font(base_font, badge_size, state))
+            painter.setPen(text_pen)
             painter.drawText(
                 badge_x,
                 badge_y,
@@ -385,7 +516,8 @@ class FlagIconDelegate(StatusDelegate):
                 Qt.AlignmentFlag.AlignCenter,
                 text,
             )
-        painter.restore()
+        painter.end()
+        return pixmap
 
 
 def _on_browser_did_fetch_columns(columns: dict[str, Column]) -> None:
@@ -405,37 +537,41 @@ def _on_browser_did_fetch_columns(columns: dict[str, Column]) -> None:
 
 
 def _on_browser_did_fetch_row(card_or_note_id, is_note, row, columns) -> None:
-    row._flag_indicator = 0
-    row._state_badges = ()
-    if is_note:
+    color = row.color
+    if is_note or color is None:
         return
 
-    settings = get_settings()
-    sort_field_index = (
-        _sort_field_index(columns)
-        if settings.show_state_prefixes_in_sort_field
-        else None
+    show_badges = (
+        get_settings().show_state_prefixes_in_sort_field
+        and _SORT_FIELD_COLUMN_KEY in columns
+    )
+    if not _ROW_STATE_BY_BG_KEY:
+        _build_row_state_tables()
+    flag_index, queue, is_marked = _ROW_STATE_BY_BG_KEY.get(
+        (color.get("light"), color.get("dark")), _NO_ROW_STATE
     )
-    color_key = _color_key(row.color)
-    flag_index = _FLAG_INDEX_BY_BG_KEY.get(color_key, 0)
     if flag_index:
         row._flag_indicator = flag_index
 
-    queue, is_marked = _display_state(color_key)
-    needs_lookup = bool(flag_index) or (
-        sort_field_index is not None and color_key == _MARKED_BG_KEY
-    )
-    if needs_lookup:
+    if flag_index or (show_badges and is_marked):
         state = _lookup_card_state(card_or_note_id)
         if state is not None:
             queue, is_marked = state
         elif flag_index:
             queue, is_marked = 0, False
 
+    if not flag_index and not show_badges:
+        return
+    base_color, badges = _row_decoration(queue, is_marked)
     if flag_index:
-        row.color = _base_color_for_state(queue, is_marked)
-    if sort_field_index is not None:
-        row._state_badges = _state_badges(queue, is_marked)
+        row.color = base_color
+    if show_badges:
+        row._state_badges = badges
+
+
+def _on_theme_did_change() -> None:
+    rebuild_paint_caches()
+    refresh_browser_view()
 
 
 def _on_browser_will_show(browser) -> None:
@@ -444,14 +580,17 @@ def _on_browser_will_show(browser) -> None:
         return
 
     model = browser.table._model
-    if model.active_column_index(_FLAG_COLUMN_KEY) is None:
-        model.toggle_column(_FLAG_COLUMN_KEY)
-
     delegate = getattr(browser, "_flag_icon_delegate", None)
     if delegate is None:
         delegate = FlagIconDelegate(browser, model)
         browser._flag_icon_delegate = delegate
-    view.setItemDelegate(delegate)
+    if view.itemDelegate() is not delegate:
+        view.setItemDelegate(delegate)
+    if getattr(browser, "_flag_column_installed", False):
+        return
+
+    if model.active_column_index(_FLAG_COLUMN_KEY) is None:
+        model.toggle_column(_FLAG_COLUMN_KEY)
 
     header = view.horizontalHeader()
     if header is None:
@@ -465,5 +604,8 @@ def _on_browser_will_show(browser) -> None:
         header.moveSection(visual, 0)
     if header.minimumSectionSize() > _FLAG_COLUMN_WIDTH:
         header.setMinimumSectionSize(_FLAG_COLUMN_WIDTH)
-    header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
-    view.setColumnWidth(column, _FLAG_COLUMN_WIDTH)
+    if header.sectionResizeMode(column) != QHeaderView.ResizeMode.Fixed:
+        header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+    if view.columnWidth(column) != _FLAG_COLUMN_WIDTH:
+        view.setColumnWidth(column, _FLAG_COLUMN_WIDTH)
+    browser._flag_column_installed = True
@@ -15,6 +15,7 @@ from aqt.qt import (
     QPainterPath,
     QPen,
     QRadioButton,
+    QRect,
     QTimer,
     QVBoxLayout,
     QWidget,
@@ -35,6 +36,7 @@ from .browser_features import (
     FLAG_PREVIEW_COLORS,
     flag_theme_qcolor,
     outline_color_for_mode,
+    rebuild_paint_caches,
     refresh_browser_view,
 )
 
@@ -50,16 +52,20 @@ class FlagColumnSettingsDialog(QDialog):
         options.addWidget(QLabel("Flag outline color"))
 
         self._buttons: dict[str, QRadioButton] = {}
+        self._mode_by_id: dict[int, str] = {}
         self._group = QButtonGroup(self)
-        for label, mode in (
-            ("Auto (match theme)", OUTLINE_MODE_AUTO),
-            ("Always black", OUTLINE_MODE_BLACK),
-            ("Always white", OUTLINE_MODE_WHITE),
-            ("Match flag color", OUTLINE_MODE_FLAG),
+        for mode_id, (label, mode) in enumerate(
+            (
+                ("Auto (match theme)", OUTLINE_MODE_AUTO),
+                ("Always black", OUTLINE_MODE_BLACK),
+                ("Always white", OUTLINE_MODE_WHITE),
+                ("Match flag color", OUTLINE_MODE_FLAG),
+            )
         ):
             button = QRadioButton(label)
-            self._group.addButton(button)
+            self._group.addButton(button, mode_id)
             self._buttons[mode] = button
+            self._mode_by_id[mode_id] = mode
             options.addWidget(button)
 
         options.addSpacing(12)
@@ -127,10 +133,7 @@ class FlagColumnSettingsDialog(QDialog):
             self._sync_preview_mode()
 
     def _selected_outline_mode(self) -> str:
-        for mode, button in self._buttons.items():
-            if button.isChecked():
-                return mode
-        return OUTLINE_MODE_AUTO
+        return self._mode_by_id.get(self._group.checkedId(), OUTLINE_MODE_AUTO)
 
     def _selected_settings(self) -> AddonSettings:
         return AddonSettings(
@@ -140,6 +143,7 @@ class FlagColumnSettingsDialog(QDialog):
 
     def accept(self) -> None:
         save_settings(self._selected_settings())
+        rebuild_paint_caches()
         refresh_browser_view(force_refetch=True)
         super().accept()
 
@@ -152,6 +156,10 @@ class _AnimatedFlagPreview(QWidget):
     def __init__(self, night_mode: bool, parent=None) -> None:
         super().__init__(parent)
         self._night_mode = night_mode
+        self._flag_qcolors = tuple(
+            flag_theme_qcolor(color, night_mode) for color in FLAG_PREVIEW_COLORS
+        )
+        self._blend_color = QColor()
         self._outline_mode = OUTLINE_MODE_AUTO
         self._phase_ms = 0
         self._current_index = 0
@@ -160,6 +168,8 @@ class _AnimatedFlagPreview(QWidget):
         self._timer.setInterval(self._TICK_MS)
         self._timer.timeout.connect(self._on_tick)
         self._timer.start()
+        self._glyph_path = QPainterPath()
+        self._glyph_key: tuple[str, int, int, int, int] | None = None
         self.setMinimumSize(92, 92)
 
     def set_outline_mode(self, mode: str) -> None:
@@ -180,31 +190,32 @@ class _AnimatedFlagPreview(QWidget):
         if len(FLAG_PREVIEW_COLORS) <= 1:
             return
         cycle_length = self._HOLD_MS + self._FADE_MS
-        self._phase_ms += self._TICK_MS
+        self._phase_ms += self._timer.interval()
         if self._phase_ms >= cycle_length:
             self._phase_ms -= cycle_length
             self._current_index = self._next_index
             self._next_index = (self._next_index + 1) % len(FLAG_PREVIEW_COLORS)
+        if self._phase_ms < self._HOLD_MS:
+            # The colour is static until the next fade, so sleep through the hold.
+            self._timer.start(self._HOLD_MS - self._phase_ms)
+        elif self._timer.interval() != self._TICK_MS:
+            self._timer.start(self._TICK_MS)
         self.update()
 
-    def _current_flag_color(self) -> dict[str, str] | None:
-        if not FLAG_PREVIEW_COLORS:
+    def _current_flag_qcolor(self) -> QColor | None:
+        if not self._flag_qcolors:
             return None
-        if len(FLAG_PREVIEW_COLORS) == 1:
-            return FLAG_PREVIEW_COLORS[0]
+        if len(self._flag_qcolors) == 1:
+            return self._flag_qcolors[0]
 
-        current = FLAG_PREVIEW_COLORS[self._current_index]
+        current = self._flag_qcolors[self._current_index]
         if self._phase_ms < self._HOLD_MS:
             return current
 
-        next_color = FLAG_PREVIEW_COLORS[self._next_index]
         progress = (self._phase_ms - self._HOLD_MS) / self._FADE_MS
-        blended = _interpolate_color(
-            flag_theme_qcolor(current, self._night_mode),
-            flag_theme_qcolor(next_color, self._night_mode),
-            progress,
-        ).name()
-        return {"light": blended, "dark": blended}
+        return _interpolate_color(
+            current, self._flag_qcolors[self._next_index], progress, self._blend_color
+        )
 
     def paintEvent(self, _event) -> None:
         rect = self.rect().adjusted(5, 5, -5, -5)
@@ -222,26 +233,34 @@ class _AnimatedFlagPreview(QWidget):
         painter.setBrush(background)
         painter.drawRoundedRect(rect, 8, 8)
 
-        flag_color = self._current_flag_color()
-        if flag_color is None:
+        fill = self._current_flag_qcolor()
+        if fill is None:
             return
 
-        fill = flag_theme_qcolor(flag_color, self._night_mode)
-        outline = outline_color_for_mode(
-            self._outline_mode, flag_color, self._night_mode
-        )
+        if self._outline_mode == OUTLINE_MODE_FLAG:
+            outline = fill
+        else:
+            outline = outline_color_for_mode(self._outline_mode, None, self._night_mode)
+        painter.setPen(QPen(outline, 1.2))
+        painter.setBrush(fill)
+        painter.drawPath(self._flag_path(rect))
+
+    def _flag_path(self, rect: QRect) -> QPainterPath:
+        family = self.font().family()
+        key = (family, rect.left(), rect.top(), rect.width(), rect.height())
+        if key == self._glyph_key:
+            return self._glyph_path
+
         font = QFont(self.font())
         font.setPixelSize(int(min(rect.width(), rect.height()) * 0.62))
         metrics = QFontMetrics(font)
         text_width = metrics.horizontalAdvance(FLAG_GLYPH)
         x = rect.left() + (rect.width() - text_width) // 2
         y = rect.top() + (rect.height() + metrics.ascent() - metrics.descent()) // 2
-        path = QPainterPath()
-        path.addText(x, y, font, FLAG_GLYPH)
-
-        painter.setPen(QPen(outline, 1.2))
-        painter.setBrush(fill)
-        painter.drawPath(path)
+        self._glyph_path.clear()
+        self._glyph_path.addText(x, y, font, FLAG_GLYPH)
+        self._glyph_key = key
+        return self._glyph_path
 
 
 def open_settings_dialog() -> None:
@@ -251,22 +270,15 @@ def open_settings_dialog() -> None:
     dialog.exec()
 
 
-def setup_config_menu() -> None:
-    if aqt.mw is None:
-        return
-    if getattr(aqt.mw, "_flag_column_config_action", None) is not None:
-        return
-    action = aqt.mw.form.menuTools.addAction("Flag Column Settings...")
-    action.triggered.connect(open_settings_dialog)
-    aqt.mw._flag_column_config_action = action
-
-
-def _interpolate_color(start: QColor, end: QColor, progress: float) -> QColor:
-    progress = min(max(progress, 0.0), 1.0)
-    inverse = 1.0 - progress
-    return QColor(
-        round(start.red() * inverse + end.red() * progress),
-        round(start.green() * inverse + end.green() * progress),
-        round(start.blue() * inverse + end.blue() * progress),
-        round(start.alpha() * inverse + end.alpha() * progress),
+def _interpolate_color(
+    start: QColor, end: QColor, progress: float, target: QColor
+) -> QColor:
+    weight = min(max(int(progress * 256), 0), 256)
+    inverse = 256 - weight
+    target.setRgb(
+        (start.red() * inverse + end.red() * weight) >> 8,
+        (start.green() * inverse + end.green() * weight) >> 8,
+        (start.blue() * inverse + end.blue() * weight) >> 8,
+        (start.alpha() * inverse + end.alpha() * weight) >> 8,
     )
+    return target